@@ -0,0 +1,66 @@
+"""Whole-college analytics latency: cold (cache cleared, one matrix query per class) vs cached.
+
+Uploads a synthetic college of N students per class (default 300) through the admin upload
+routes, then times college_analytics() for the 1st term with the analytics cache cleared before
+every run (cold) and left warm (cached), plus a GET /admin/analytics page render.
+
+Usage: python benchmarks/bench_analytics.py [students] [repeats]
+"""
+import io
+import statistics
+import sys
+import time
+
+from common import QueryCounter, use_temp_database
+
+use_temp_database()
+
+from app import app, db, init_db, college_analytics, invalidate_class_results  # noqa: E402
+from dataset import generate_college  # noqa: E402
+
+TERM = 'first'
+
+
+def upload(client, url, df, **data):
+    data['file'] = (io.BytesIO(df.to_csv(index=False).encode()), 'bench.csv')
+    client.post(url, data=data, content_type='multipart/form-data')
+
+
+def measure(fn, repeats, counter, cold):
+    times, queries = [], 0
+    for _ in range(repeats):
+        if cold:
+            invalidate_class_results()
+        counter.reset()
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+        queries = counter.count
+    return statistics.median(times), max(times), queries
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    init_db()
+    app.config.update(TESTING=True, UPLOAD_JOB_WORKERS=0)
+    client = app.test_client()
+    client.post('/login', data={'username': 'hamdan', 'password': '123456'})
+    students, results = generate_college(n)
+    upload(client, '/admin/upload_students', students)
+    for (class_grade, term), df in results.items():
+        upload(client, '/admin/upload_results', df, class_grade=class_grade, result_type=term)
+
+    with app.app_context():
+        counter = QueryCounter(db.engine)
+        print(f'{len(students)} students, {TERM} term, {repeats} runs')
+        print(f'{"case":<10} {"median ms":>10} {"max ms":>8} {"queries":>8}')
+        for name, fn, cold in (('cold', lambda: college_analytics(TERM), True),
+                               ('cached', lambda: college_analytics(TERM), False),
+                               ('page', lambda: client.get(f'/admin/analytics?class_grade=all&term={TERM}'), False)):
+            median, worst, queries = measure(fn, repeats, counter, cold)
+            print(f'{name:<10} {median:>10.2f} {worst:>8.2f} {queries:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Concurrent read/write throughput on one SQLite file, with and without the connection pragmas.
+
+Seeds one class of N students with marks, then forks worker processes (like gunicorn workers)
+that for a fixed time either read the teacher_search data (class_subject_marks) or save a mark
+and commit, as teachers do during result week. Reported per mode: reads/s, writes/s, p95 write
+latency and "database is locked" failures.
+
+  - default: SQLite's own settings (rollback journal, synchronous=FULL, the driver's 5s timeout)
+  - tuned:   app.config['SQLITE_PRAGMAS'] (WAL, synchronous=NORMAL, busy_timeout, mmap, cache)
+
+Usage: python benchmarks/bench_sqlite_concurrency.py [students] [readers] [writers] [seconds]
+"""
+import multiprocessing
+import random
+import sys
+import time
+
+from common import use_temp_database
+
+use_temp_database()
+
+from sqlalchemy import insert, text, update  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from app import app, db, init_db, User, Student, Mark, SUBJECT_FULL_MARKS, class_subject_marks  # noqa: E402
+
+CLASS = '10'
+SUBJECT = 'Math'
+
+
+def seed(n):
+    users = [{'username': f'c{i}', 'password_hash': 'x', 'role': 'student', 'approved': True} for i in range(n)]
+    db.session.execute(insert(User), users)
+    ids = dict(db.session.query(User.username, User.id).filter(User.role == 'student'))
+    db.session.execute(insert(Student), [{'user_id': ids[f'c{i}'], 'roll_number': f'{i:05d}', 'name': f'Student {i}',
+                                          'class_grade': CLASS, 'house_name': 'Iqbal'} for i in range(n)])
+    sids = [sid for (sid,) in db.session.query(Student.id)]
+    db.session.execute(insert(Mark), [{'student_id': sid, 'subject': subj, 'class_grade': CLASS,
+                                       'first_term': 50.0, 'second_term': 40.0, 'board_mark': 0.0}
+                                      for sid in sids for subj in SUBJECT_FULL_MARKS[CLASS]])
+    db.session.commit()
+
+
+def worker(role, seconds, mark_ids, results):
+    ops, locked, latencies = 0, 0, []
+    deadline = time.perf_counter() + seconds
+    try:
+        with app.app_context():
+            db.engine.dispose(close=False)  # connections inherited from the parent are not shared across the fork
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    if role == 'read':
+                        class_subject_marks(CLASS, SUBJECT)
+                    else:
+                        db.session.execute(update(Mark), [{'id': random.choice(mark_ids),
+                                                           'first_term': float(random.randint(0, 75))}])
+                        db.session.commit()
+                    ops += 1
+                    latencies.append(time.perf_counter() - start)
+                except OperationalError as e:
+                    db.session.rollback()
+                    if 'locked' not in str(e):
+                        raise
+                    locked += 1
+    finally:
+        results.put((role, ops, locked, latencies))  # always report, so the parent never waits forever
+
+
+def run(mode, readers, writers, seconds, mark_ids):
+    app.config['SQLITE_PRAGMAS'] = TUNED if mode == 'tuned' else {}
+    with app.app_context():
+        db.engine.dispose()
+        if mode == 'default':
+            db.session.execute(text('PRAGMA journal_mode = DELETE'))  # WAL persists in the file
+            db.session.commit()
+    results = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=worker, args=(role, seconds, mark_ids, results))
+             for role in ['read'] * readers + ['write'] * writers]
+    for p in procs:
+        p.start()
+    totals = {'read': [0, 0, []], 'write': [0, 0, []]}
+    for _ in procs:
+        role, ops, locked, latencies = results.get()
+        totals[role][0] += ops
+        totals[role][1] += locked
+        totals[role][2] += latencies
+    for p in procs:
+        p.join()
+    write_lat = sorted(totals['write'][2]) or [0.0]
+    return (totals['read'][0] / seconds, totals['write'][0] / seconds,
+            write_lat[int(len(write_lat) * 0.95) - 1 if len(write_lat) > 1 else 0] * 1000,
+            totals['read'][1] + totals['write'][1])
+
+
+TUNED = dict(app.config['SQLITE_PRAGMAS'])
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    writers = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    seconds = float(sys.argv[4]) if len(sys.argv) > 4 else 5
+    init_db()
+    with app.app_context():
+        seed(n)
+        mark_ids = [mid for (mid,) in db.session.query(Mark.id).filter(Mark.subject == SUBJECT)]
+    print(f'{n} students, {readers} reader and {writers} writer processes, {seconds:g}s per mode')
+    print(f'{"mode":8} {"reads/s":>9} {"writes/s":>9} {"p95 write ms":>13} {"locked":>7}')
+    for mode in ('default', 'tuned'):
+        reads, writes, p95, locked = run(mode, readers, writers, seconds, mark_ids)
+        print(f'{mode:8} {reads:>9.0f} {writes:>9.0f} {p95:>13.1f} {locked:>7}')
+
+
+if __name__ == '__main__':
+    multiprocessing.set_start_method('fork')
+    main()
@@ -0,0 +1,68 @@
+"""Worker cold start: import app, init_db on an up-to-date database, first request; checked against a budget.
+
+Each run is a fresh interpreter (what a new worker or test process pays). The database is
+created and migrated once up front, so init_db takes the schema_version fast path as it does
+on every restart in production. Also reports whether pandas got imported along the way.
+
+Usage: python benchmarks/bench_startup.py [runs] [--budget-ms 1500]
+Exits 1 when the median import + init_db + first request time is over the budget
+(default RMS_STARTUP_BUDGET_MS, else 1500). tests/test_startup.py runs the same check.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from common import ROOT, use_temp_database
+
+BUDGET_MS = float(os.environ.get('RMS_STARTUP_BUDGET_MS', 1500))
+
+PROBE = r'''
+import json, sys, time
+start = time.perf_counter()
+import app as rms
+imported = time.perf_counter()
+rms.init_db()
+initialized = time.perf_counter()
+rms.app.test_client().get('/login')
+first_request = time.perf_counter()
+print(json.dumps({'import': imported - start, 'init_db': initialized - imported,
+                  'first_request': first_request - initialized, 'total': first_request - start,
+                  'pandas': 'pandas' in sys.modules}))
+'''
+
+
+def probe():
+    """Time one cold start in a fresh interpreter against the configured database; seconds per phase"""
+    out = subprocess.run([sys.executable, '-c', PROBE], cwd=ROOT, env=os.environ, check=True,
+                         capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    args = sys.argv[1:]
+    budget_ms = BUDGET_MS
+    if '--budget-ms' in args:
+        i = args.index('--budget-ms')
+        budget_ms = float(args[i + 1])
+        del args[i:i + 2]
+    runs = int(args[0]) if args else 5
+    use_temp_database()
+    probe()  # creates and migrates the database; not counted
+    results = [probe() for _ in range(runs)]
+    print(f'{runs} runs, fresh interpreter each')
+    print(f'{"phase":<14} {"median ms":>10} {"max ms":>8}')
+    for phase in ('import', 'init_db', 'first_request', 'total'):
+        values = [r[phase] * 1000 for r in results]
+        print(f'{phase:<14} {statistics.median(values):>10.1f} {max(values):>8.1f}')
+    print(f'pandas imported: {any(r["pandas"] for r in results)}')
+    total = statistics.median(r['total'] for r in results) * 1000
+    if total > budget_ms:
+        print(f'FAIL: median startup {total:.0f} ms is over the {budget_ms:.0f} ms budget')
+        sys.exit(1)
+    print(f'OK: median startup {total:.0f} ms within the {budget_ms:.0f} ms budget')
+
+
+if __name__ == '__main__':
+    main()
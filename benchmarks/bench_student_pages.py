@@ -0,0 +1,86 @@
+"""Student dashboard on result day: full render vs page cache hit vs 304 revalidation.
+
+Uploads one class of N students (default 300) with marks, lets them all log in, then times
+GET /student for every student in three passes:
+  - render:  page cache empty (what each visit cost before the cache)
+  - cached:  second visit, served from the per-worker page cache
+  - 304:     browser refresh with If-None-Match, answered from the cache versions alone
+and reports POST /admin/publish_results (pre-rendering the class) for comparison.
+
+Usage: python benchmarks/bench_student_pages.py [students]
+"""
+import io
+import statistics
+import sys
+import time
+
+from common import QueryCounter, use_temp_database
+
+use_temp_database()
+
+from app import app, db, init_db, User, _student_pages  # noqa: E402
+from dataset import generate_college  # noqa: E402
+
+CLASS = '10'
+
+
+def upload(client, url, df, **data):
+    data['file'] = (io.BytesIO(df.to_csv(index=False).encode()), 'bench.csv')
+    client.post(url, data=data, content_type='multipart/form-data')
+
+
+def timed_pass(clients, counter, headers=None):
+    times, queries, statuses = [], 0, set()
+    for roll, client in clients:
+        counter.reset()
+        start = time.perf_counter()
+        response = client.get('/student', headers=(headers or {}).get(roll, {}))
+        times.append((time.perf_counter() - start) * 1000)
+        queries += counter.count
+        statuses.add(response.status_code)
+    return statistics.median(times), sum(times), queries / len(clients), statuses
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    init_db()
+    app.config.update(TESTING=True, UPLOAD_JOB_WORKERS=0)
+    admin = app.test_client()
+    admin.post('/login', data={'username': 'hamdan', 'password': '123456'})
+    students, results = generate_college(n)
+    students = students[students['class_grade'] == CLASS]
+    upload(admin, '/admin/upload_students', students)
+    for (class_grade, term), df in results.items():
+        if class_grade == CLASS:
+            upload(admin, '/admin/upload_results', df, class_grade=class_grade, result_type=term)
+
+    with app.app_context():
+        User.query.filter(User.role == 'student').update({'must_change_password': False, 'approved': True})
+        db.session.commit()
+        counter = QueryCounter(db.engine)
+    clients = []
+    for roll in students['roll_number']:
+        client = app.test_client()
+        client.post('/login', data={'username': roll, 'password': roll})
+        client.get('/student')  # consumes the login flash message
+        clients.append((roll, client))
+    _student_pages.clear()
+
+    print(f'{len(clients)} students, class {CLASS}')
+    print(f'{"pass":<8} {"median ms":>10} {"total s":>8} {"queries/visit":>14} {"status":>7}')
+    etags = {}
+    for name in ('render', 'cached', '304'):
+        if name == 'render':
+            _student_pages.clear()
+        if name == '304':
+            etags = {roll: {'If-None-Match': client.get('/student').headers['ETag']} for roll, client in clients}
+        median, total, queries, statuses = timed_pass(clients, counter, etags)
+        print(f'{name:<8} {median:>10.2f} {total / 1000:>8.2f} {queries:>14.1f} {",".join(map(str, statuses)):>7}')
+    _student_pages.clear()
+    start = time.perf_counter()
+    admin.post('/admin/publish_results', data={'class_grade': CLASS})
+    print(f'publish_results for {len(_student_pages)} pages: {time.perf_counter() - start:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
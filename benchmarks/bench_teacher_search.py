@@ -0,0 +1,88 @@
+"""Microbenchmark: teacher_search before/after the single LEFT OUTER JOIN query.
+
+Builds a throwaway SQLite DB with one class of N students (default 400) who all have
+marks in every subject, then times:
+  - before: the old per-student Mark lookup (1 + N queries)
+  - after:  class_subject_marks() (1 query)
+  - view:   POST /teacher/search through the Flask test client
+
+Usage: python benchmarks/bench_teacher_search.py [students] [repeats]
+"""
+import statistics
+import sys
+import time
+
+from common import QueryCounter, use_temp_database
+
+use_temp_database()
+
+from sqlalchemy import insert  # noqa: E402
+from app import app, db, init_db, User, Student, Mark, SUBJECT_FULL_MARKS, class_subject_marks  # noqa: E402
+
+CLASS = '10'
+SUBJECT = 'Math'
+
+
+def seed(n):
+    users = [{'username': f'b{i}', 'password_hash': 'x', 'role': 'student', 'approved': True} for i in range(n)]
+    db.session.execute(insert(User), users)
+    ids = dict(db.session.query(User.username, User.id).filter(User.role == 'student'))
+    db.session.execute(insert(Student), [{'user_id': ids[f'b{i}'], 'roll_number': f'{i:05d}', 'name': f'Student {i}',
+                                          'class_grade': CLASS, 'house_name': 'Iqbal'} for i in range(n)])
+    sids = [sid for (sid,) in db.session.query(Student.id)]
+    db.session.execute(insert(Mark), [{'student_id': sid, 'subject': subj, 'class_grade': CLASS,
+                                       'first_term': 50.0, 'second_term': 40.0, 'board_mark': 0.0}
+                                      for sid in sids for subj in SUBJECT_FULL_MARKS[CLASS]])
+    teacher = User(username='bench-teacher', role='teacher', approved=True, assigned_subject=SUBJECT)
+    teacher.set_password('bench')
+    db.session.add(teacher)
+    db.session.commit()
+
+
+def before():
+    students = Student.query.filter_by(class_grade=CLASS).all()
+    for student in students:
+        student.mark = Mark.query.filter_by(student_id=student.id, subject=SUBJECT).first()
+    return students
+
+
+def after():
+    return class_subject_marks(CLASS, SUBJECT)
+
+
+def measure(fn, repeats, counter):
+    times, queries = [], 0
+    for _ in range(repeats):
+        db.session.expire_all()
+        counter.reset()
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+        queries = counter.count
+    return queries, statistics.median(times), max(times)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    init_db()
+    app.config['TESTING'] = True
+    client = app.test_client()
+    with app.app_context():
+        seed(n)
+        counter = QueryCounter(db.engine)
+        client.post('/login', data={'username': 'bench-teacher', 'password': 'bench'})
+        results = {
+            'before (N+1 lookups)': measure(before, repeats, counter),
+            'after (LEFT OUTER JOIN)': measure(after, repeats, counter),
+            'view POST /teacher/search': measure(
+                lambda: client.post('/teacher/search', data={'class_grade': CLASS}), repeats, counter),
+        }
+    print(f'teacher_search, class {CLASS}, {n} students, subject {SUBJECT}, {repeats} runs')
+    print(f'{"":28} {"queries":>8} {"median ms":>10} {"max ms":>8}')
+    for name, (queries, median, worst) in results.items():
+        print(f'{name:28} {queries:>8} {median:>10.2f} {worst:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Peak memory of an upload job against file size: streamed chunks vs reading the whole sheet.
+
+Writes results files of growing size (roll_number, subject, mark; rolls are not registered, so
+every row goes through parsing and validation and ends up in the error report), then for each
+size and format measures the tracemalloc peak of:
+  - whole:  pd.read_csv / pd.read_excel of the entire file (the old upload path's first step)
+  - job:    run_upload_job(), which streams the file in UPLOAD_CHUNK_ROWS chunks
+
+Usage: python benchmarks/bench_upload_memory.py [rows ...]   (default 5000 20000 80000)
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from common import use_temp_database
+
+use_temp_database()
+
+import pandas as pd  # noqa: E402
+from app import app, db, init_db, User, UploadJob, SUBJECT_FULL_MARKS, run_upload_job  # noqa: E402
+
+CLASS = '10'
+
+
+def results_frame(n):
+    subjects = list(SUBJECT_FULL_MARKS[CLASS])
+    return pd.DataFrame({'roll_number': [f'{900000 + i // len(subjects)}' for i in range(n)],
+                         'subject': [subjects[i % len(subjects)] for i in range(n)],
+                         'mark': [(i * 7) % 60 for i in range(n)]})
+
+
+def traced(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024 / 1024, seconds
+
+
+def run_job(path, admin_id):
+    job = UploadJob(kind='results', params=f'{{"class_grade": "{CLASS}", "result_type": "1st"}}',
+                    filename=os.path.basename(path), path=path, created_by=admin_id, created_at=time.time())
+    db.session.add(job)
+    db.session.commit()
+    run_upload_job(job.id)
+    return db.session.get(UploadJob, job.id)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [5000, 20000, 80000]
+    init_db()
+    workdir = tempfile.mkdtemp(prefix='rms-upload-')
+    print(f'{"rows":>8} {"format":>6} {"MB file":>8} {"whole MB":>9} {"job MB":>8} {"job s":>7} {"rows/s":>8}')
+    with app.app_context():
+        admin_id = User.query.filter_by(role='admin').first().id
+        for n in sizes:
+            df = results_frame(n)
+            for fmt in ('csv', 'xlsx'):
+                path = os.path.join(workdir, f'results_{n}.{fmt}')
+                if fmt == 'csv':
+                    df.to_csv(path, index=False)
+                    whole, _ = traced(lambda: pd.read_csv(path))
+                else:
+                    df.to_excel(path, index=False)
+                    whole, _ = traced(lambda: pd.read_excel(path))
+                # run_upload_job removes the file, so hand it a copy
+                copy = path + '.job.' + fmt
+                with open(path, 'rb') as src, open(copy, 'wb') as dst:
+                    dst.write(src.read())
+                job_peak, seconds = traced(lambda: run_job(copy, admin_id))
+                job = UploadJob.query.order_by(UploadJob.id.desc()).first()
+                assert job.status == 'done' and job.processed_rows == n, (job.status, job.message)
+                size_mb = os.path.getsize(path) / 1024 / 1024
+                print(f'{n:>8} {fmt:>6} {size_mb:>8.2f} {whole:>9.1f} {job_peak:>8.1f} {seconds:>7.2f} {n / seconds:>8.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Shared setup for the benchmark scripts: a throwaway database and a SQL query counter.
+
+Import this module (and call use_temp_database) before importing app, since the app
+binds its database URI at import time.
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_temp_database(name='bench.db'):
+    """Point the app at a fresh SQLite file in a temp dir, also used as its instance path; returns the URI.
+
+    Set RMS_BENCH_DATABASE_URI (e.g. postgresql://localhost/rms_bench) to run against an
+    empty database of another backend instead; it is used as-is, so give it a throwaway one.
+    Uploads, archives and profiles still go to the temp dir, never the repo's instance/.
+    """
+    instance = tempfile.mkdtemp(prefix='rms-bench-')
+    uri = os.environ.get('RMS_BENCH_DATABASE_URI') or 'sqlite:///' + os.path.join(instance, name)
+    os.environ['RMS_DATABASE_URI'] = uri
+    os.environ['RMS_INSTANCE_PATH'] = instance
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    return uri
+
+
+class QueryCounter:
+    """Counts statements executed on an engine while attached"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self.count = 0
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def reset(self):
+        self.count = 0
@@ -0,0 +1,58 @@
+"""Synthetic college generator for benchmarks.
+
+generate_college(n) returns the same shapes the bulk upload pages accept:
+  - a students DataFrame (roll_number, name, house_name, class_grade) with n students per class
+  - results DataFrames (roll_number, subject, mark) per (class, result type), covering every
+    subject in SUBJECT_FULL_MARKS for every student
+
+Run directly to write the CSV files: python benchmarks/dataset.py 300 out_dir/
+"""
+import os
+import random
+import sys
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+FIRST_NAMES = ['Ahmad', 'Ali', 'Fatima', 'Hassan', 'Zainab', 'Usman', 'Ayesha', 'Bilal', 'Hamza', 'Sara',
+               'Omar', 'Maryam', 'Ibrahim', 'Hira', 'Saad', 'Amna', 'Talha', 'Khadija', 'Hamid', 'Iqra']
+LAST_NAMES = ['Khan', 'Malik', 'Qureshi', 'Sheikh', 'Butt', 'Chaudhry', 'Raza', 'Iqbal', 'Siddiqui', 'Abbasi']
+HOUSES = ['Iqbal', 'Jinnah', 'Quaid', 'Liaquat', 'Sir Syed']
+RESULT_TYPES = ['1st', '2nd', 'board']
+
+
+def generate_college(students_per_class, seed=0):
+    """Return (students_df, {(class_grade, result_type): results_df})"""
+    from app import ALLOWED_CLASSES, SUBJECT_FULL_MARKS
+    rng = random.Random(seed)
+    students, results = [], {}
+    for class_grade in ALLOWED_CLASSES:
+        rolls = [f'{class_grade}{i:05d}' for i in range(students_per_class)]
+        for roll in rolls:
+            students.append({'roll_number': roll,
+                             'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+                             'house_name': rng.choice(HOUSES),
+                             'class_grade': class_grade})
+        for result_type in RESULT_TYPES:
+            rows = [{'roll_number': roll, 'subject': subject, 'mark': round(rng.uniform(0.2, 1.0) * full * 2) / 2}
+                    for roll in rolls for subject, full in SUBJECT_FULL_MARKS[class_grade].items()]
+            results[(class_grade, result_type)] = pd.DataFrame(rows)
+    return pd.DataFrame(students), results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    out = sys.argv[2] if len(sys.argv) > 2 else 'synthetic_college'
+    os.makedirs(out, exist_ok=True)
+    students, results = generate_college(n)
+    students.to_csv(os.path.join(out, 'students.csv'), index=False)
+    for (class_grade, result_type), df in results.items():
+        df.to_csv(os.path.join(out, f'results_{class_grade}_{result_type}.csv'), index=False)
+    print(f'wrote {len(students)} students and {sum(len(df) for df in results.values())} marks to {out}/')
+
+
+if __name__ == '__main__':
+    main()
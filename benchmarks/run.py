@@ -0,0 +1,193 @@
+"""Benchmark harness for the RMS hot paths.
+
+Generates a synthetic college (benchmarks/dataset.py) into a throwaway SQLite DB and drives
+the Flask test client through the bulk uploads and the main read pages:
+
+  upload_students, upload_results, class_results, admin_dashboard, teacher_search, search
+
+For each scenario it records per-request latency percentiles, SQL query counts, and the
+peak Python heap (tracemalloc) of one extra traced pass, then writes a JSON report and a
+CSV summary. Pass --compare with an earlier JSON report to print the change per scenario.
+
+Usage: python benchmarks/run.py --students 300 --repeat 20 --output bench_report
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from common import QueryCounter, use_temp_database
+
+DB_URI = use_temp_database()
+
+from app import app, db, init_db, User, ALLOWED_CLASSES, SUBJECT_FULL_MARKS  # noqa: E402
+from dataset import generate_college  # noqa: E402
+
+ADMIN = {'username': 'hamdan', 'password': '123456'}
+SEARCH_TERMS = ['Fatima', 'khan', '10000', '1200', 'Iqbal', 'zz']
+
+
+def sqlite_size_mb(uri):
+    # database file plus its WAL, which holds pages not yet checkpointed; None for server databases
+    if not uri.startswith('sqlite:///'):
+        return None
+    path = uri[len('sqlite:///'):]
+    size = sum(os.path.getsize(p) for p in (path, path + '-wal') if os.path.exists(p))
+    return round(size / (1024 * 1024), 2)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def csv_upload(df, name):
+    return (io.BytesIO(df.to_csv(index=False).encode()), name)
+
+
+def build_scenarios(client, teacher_client, students, results, repeat):
+    """(name, [request thunk, ...], passes, once) in execution order; writes run before reads.
+
+    Scenarios marked `once` cannot be repeated, so their peak memory is traced during the timed
+    run (their latency includes tracemalloc overhead). The rest are traced on one extra pass.
+    """
+    scenarios = [
+        ('upload_students', [lambda: client.post('/admin/upload_students',
+                                                 data={'file': csv_upload(students, 'students.csv')})], 1, True),
+        ('upload_results', [
+            (lambda c=c, t=t, df=df: client.post('/admin/upload_results', data={
+                'class_grade': c, 'result_type': t, 'file': csv_upload(df, 'results.csv')}))
+            for (c, t), df in results.items()], 1, False),
+    ]
+    reads = [
+        ('class_results', [lambda c=c: client.post('/admin/class_results', data={'class_grade': c})
+                           for c in ALLOWED_CLASSES]),
+        ('admin_dashboard', [lambda: client.get('/admin')]),
+        ('teacher_search', [lambda c=c: teacher_client.post('/teacher/search', data={'class_grade': c})
+                            for c in ALLOWED_CLASSES]),
+        ('search', [lambda q=q: client.get('/search', query_string={'q': q}) for q in SEARCH_TERMS]),
+    ]
+    scenarios += [(name, thunks, repeat, False) for name, thunks in reads]
+    return scenarios
+
+
+def run_scenario(thunks, counter):
+    latencies, queries = [], []
+    for thunk in thunks:
+        counter.reset()
+        start = time.perf_counter()
+        response = thunk()
+        latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(counter.count)
+        if response.status_code >= 400:
+            raise RuntimeError(f'{response.request.path} returned {response.status_code}')
+    return latencies, queries
+
+
+def traced_peak(thunks):
+    tracemalloc.start()
+    try:
+        for thunk in thunks:
+            thunk()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def summarize(name, latencies, queries, peak_mb):
+    return {
+        'scenario': name,
+        'requests': len(latencies),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'max_ms': round(max(latencies), 2),
+        'mean_queries': round(statistics.mean(queries), 1),
+        'max_queries': max(queries),
+        'peak_mem_mb': round(peak_mb, 2),
+    }
+
+
+def compare(report, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {row['scenario']: row for row in json.load(f)['scenarios']}
+    print(f'\nchange vs {baseline_path}:')
+    for row in report['scenarios']:
+        old = baseline.get(row['scenario'])
+        if not old:
+            continue
+        delta = (row['p95_ms'] - old['p95_ms']) / old['p95_ms'] * 100 if old['p95_ms'] else 0.0
+        print(f"  {row['scenario']:16} p95 {old['p95_ms']:>9.2f} -> {row['p95_ms']:>9.2f} ms ({delta:+.0f}%)"
+              f"   queries {old['max_queries']} -> {row['max_queries']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=200, help='students per class (8-12)')
+    parser.add_argument('--repeat', type=int, default=10, help='passes over each read scenario')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_report', help='report path prefix (.json and .csv are added)')
+    parser.add_argument('--compare', help='earlier JSON report to diff against')
+    args = parser.parse_args()
+
+    init_db()
+    app.config['TESTING'] = True
+    app.config['UPLOAD_JOB_WORKERS'] = 0  # run upload jobs inside the request so their time is measured
+    students, results = generate_college(args.students, args.seed)
+    with app.app_context():
+        teacher = User(username='bench-teacher', role='teacher', approved=True,
+                       assigned_subject=next(iter(SUBJECT_FULL_MARKS['10'])))
+        teacher.set_password('bench')
+        db.session.add(teacher)
+        db.session.commit()
+        counter = QueryCounter(db.engine)
+
+    client, teacher_client = app.test_client(), app.test_client()
+    client.post('/login', data=ADMIN)
+    teacher_client.post('/login', data={'username': 'bench-teacher', 'password': 'bench'})
+
+    rows = []
+    for name, thunks, passes, once in build_scenarios(client, teacher_client, students, results, args.repeat):
+        if once:
+            tracemalloc.start()
+            latencies, queries = run_scenario(thunks, counter)
+            peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+        else:
+            latencies, queries = run_scenario(thunks * passes, counter)
+            peak = traced_peak(thunks)
+        rows.append(summarize(name, latencies, queries, peak))
+        print(f"{name:16} p50 {rows[-1]['p50_ms']:>9.2f} ms  p95 {rows[-1]['p95_ms']:>9.2f} ms  "
+              f"queries {rows[-1]['max_queries']:>5}  peak {rows[-1]['peak_mem_mb']} MB")
+
+    report = {
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'students_per_class': args.students,
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'database': DB_URI.split(':', 1)[0],
+        'db_size_mb': sqlite_size_mb(DB_URI),
+        'scenarios': rows,
+    }
+    with open(args.output + '.json', 'w') as f:
+        json.dump(report, f, indent=2)
+    with open(args.output + '.csv', 'w') as f:
+        f.write(','.join(rows[0]) + '\n')
+        for row in rows:
+            f.write(','.join(str(v) for v in row.values()) + '\n')
+    print(f'\nwrote {args.output}.json and {args.output}.csv')
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
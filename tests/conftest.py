@@ -0,0 +1,105 @@
+"""Shared fixtures: the app on a throwaway database, an admin client and an upload helper.
+
+Set RMS_TEST_DATABASE_URI (e.g. postgresql://localhost/rms_test) to run the suite against an
+empty database of another backend; otherwise it gets a fresh SQLite file in a temp dir. app
+binds its database URI and instance path at import time, so both are set here first.
+"""
+import io
+import os
+import sys
+import tempfile
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from sqlalchemy import event
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INSTANCE = tempfile.mkdtemp(prefix='rms-test-')
+os.environ['RMS_DATABASE_URI'] = os.environ.get('RMS_TEST_DATABASE_URI') or \
+    'sqlite:///' + os.path.join(INSTANCE, 'test.db')
+os.environ['RMS_INSTANCE_PATH'] = INSTANCE
+os.environ['RMS_UPLOAD_JOB_WORKERS'] = '0'  # upload jobs run inside the request
+for path in (ROOT, os.path.join(ROOT, 'benchmarks')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture(scope='session')
+def rms():
+    """The app module, with tables created and the admin seeded"""
+    import app as rms
+    rms.app.config['TESTING'] = True
+    rms.init_db()
+    return rms
+
+
+@pytest.fixture
+def app(rms):
+    """The app with no students, marks, upload jobs or non-admin logins left over.
+
+    No context stays pushed: each test-client request gets its own, as in production, so wrap direct
+    database setup and assertions in `with app.app_context():`.
+    """
+    with rms.app.app_context():
+        rms.delete_students(rms.Student.id.isnot(None))
+        rms.db.session.query(rms.UploadJobError).delete()
+        rms.db.session.query(rms.UploadJob).delete()
+        rms.db.session.query(rms.User).filter(rms.User.role != 'admin').delete()
+        rms.db.session.commit()
+    return rms.app
+
+
+@pytest.fixture
+def admin(app):
+    """Test client logged in as the seeded admin"""
+    client = app.test_client()
+    client.post('/login', data={'username': 'hamdan', 'password': '123456'})
+    return client
+
+
+@pytest.fixture
+def upload(admin):
+    """upload(kind, csv_text, **form) posts a file to /admin/upload_<kind> and returns the job's status JSON"""
+    def upload(kind, csv_text, **form):
+        response = admin.post(f'/admin/upload_{kind}', data={'file': (io.BytesIO(csv_text.encode()), 'upload.csv'), **form})
+        job_id = parse_qs(urlparse(response.headers['Location']).query)['job'][0]
+        return admin.get(f'/admin/jobs/{job_id}').get_json()
+    return upload
+
+
+class QueryCounter:
+    """Counts statements run on an engine inside a with block"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._on_execute)
+
+
+@pytest.fixture
+def queries(rms, app):
+    """`with queries:` counts the statements run on the app's database in the block"""
+    with app.app_context():
+        return QueryCounter(rms.db.engine)
+
+
+@pytest.fixture
+def teacher(rms, app):
+    """Test client logged in as an approved Math teacher"""
+    with app.app_context():
+        user = rms.User(username='teacher1', role='teacher', approved=True, assigned_subject='Math')
+        user.set_password('secret1')
+        rms.db.session.add(user)
+        rms.db.session.commit()
+    client = app.test_client()
+    client.post('/login', data={'username': 'teacher1', 'password': 'secret1'})
+    return client
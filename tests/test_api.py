@@ -0,0 +1,100 @@
+import gzip
+import json
+
+import pytest
+
+STUDENTS_CSV = """roll_number,name,house_name,class_grade
+A001,Asha Khan,Iqbal,10
+A002,Bilal Ahmed,Jinnah,10
+A003,Chen Li,Sir Syed,10
+A004,Dina Malik,Iqbal,10
+A005,Esa Raza,Jinnah,10
+B001,Farah Noor,Iqbal,9
+"""
+FIRST_TERM_CSV = """roll_number,subject,mark
+A001,Math,60
+A001,English,50
+A002,Math,70
+"""
+
+
+@pytest.fixture
+def api(rms, app, upload, monkeypatch):
+    """Test client for the JSON API with token 'secret' (client 'sms') and the class 10 results uploaded"""
+    upload('students', STUDENTS_CSV)
+    upload('results', FIRST_TERM_CSV, class_grade='10', result_type='1st')
+    monkeypatch.setitem(app.config, 'API_TOKENS', {'secret': 'sms'})
+    monkeypatch.setattr(rms, '_api_buckets', {})
+    client = app.test_client()
+    client.environ_base['HTTP_AUTHORIZATION'] = 'Bearer secret'
+    return client
+
+
+def test_api_requires_a_token(api, app):
+    response = app.test_client().get('/api/v1/classes/10/results', headers={'Authorization': 'Bearer wrong'})
+
+    assert response.status_code == 401
+    assert response.get_json() == {'error': 'Missing or invalid API token'}
+    assert response.headers['WWW-Authenticate'] == 'Bearer'
+
+
+def test_api_admin_session_needs_no_token(api, admin):
+    assert admin.get('/api/v1/classes/10/results').status_code == 200
+
+
+def test_api_class_pages_follow_the_cursor(api):
+    rolls, url = [], '/api/v1/classes/10/results?per_page=2&fields=name'
+    while url:
+        page = api.get(url).get_json()
+        assert page['total'] == 5 and page['count'] <= 2
+        rolls += [r['roll_number'] for r in page['results']]
+        url = page['next']
+
+    assert rolls == ['A001', 'A002', 'A003', 'A004', 'A005']
+
+
+def test_api_student_record(api):
+    record = api.get('/api/v1/students/A001/results?term=first').get_json()
+
+    assert record['marks'] == {'English': {'first': 50}, 'Math': {'first': 60}}
+    assert record['totals']['first']['obtained'] == 110
+    assert record['position'] == 1
+    assert api.get('/api/v1/students/A003/results').get_json()['position'] is None
+    assert api.get('/api/v1/students/Z999/results').status_code == 404
+
+
+def test_api_fields_and_term_are_validated(api):
+    page = api.get('/api/v1/subjects/Math/results?class_grade=10&fields=name,position').get_json()
+
+    assert {tuple(sorted(r)) for r in page['results']} == {('name', 'position', 'roll_number')}
+    assert api.get('/api/v1/classes/10/results?fields=name,secret').status_code == 400
+    assert api.get('/api/v1/classes/10/results?term=third').status_code == 400
+    assert api.get('/api/v1/classes/13/results').status_code == 404
+
+
+def test_api_students_by_roll_lists_missing(api):
+    data = api.get('/api/v1/students/results?rolls=B001,A002,Z999&fields=class_grade').get_json()
+
+    assert [(r['roll_number'], r['class_grade']) for r in data['results']] == [('A002', '10'), ('B001', '9')]
+    assert data['missing'] == ['Z999']
+    assert api.get('/api/v1/students/results').status_code == 400
+
+
+def test_api_rate_limit(api, app, monkeypatch):
+    monkeypatch.setitem(app.config, 'API_RATE_BURST', 2)
+    statuses = [api.get('/api/v1/students/A001/results?fields=name') for _ in range(3)]
+
+    assert [r.status_code for r in statuses] == [200, 200, 429]
+    assert statuses[1].headers['X-RateLimit-Remaining'] == '0'
+    assert int(statuses[2].headers['Retry-After']) >= 1
+
+
+def test_api_gzips_large_bodies(api):
+    plain = api.get('/api/v1/classes/10/results')
+    compressed = api.get('/api/v1/classes/10/results', headers={'Accept-Encoding': 'gzip'})
+
+    assert len(plain.data) >= 1024 and 'Content-Encoding' not in plain.headers
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+    small = api.get('/api/v1/students/A001/results?fields=name', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in small.headers
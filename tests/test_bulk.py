@@ -0,0 +1,29 @@
+from app import User, db
+
+
+def test_teacher_reset_keeps_teachers_out_of_the_change_password_page(app, admin, teacher):
+    page = admin.post('/admin/bulk/reset_passwords', data={'role': 'teacher', 'class_grade': ''},
+                      follow_redirects=True).get_data(as_text=True)
+    assert '✓ Reset 1 teachers to &#39;1234&#39; (' in page
+
+    with app.app_context():
+        user = User.query.filter_by(username='teacher1').one()
+        assert user.check_password('1234') and not user.must_change_password
+    client = app.test_client()
+    response = client.post('/login', data={'username': 'teacher1', 'password': '1234'})
+    assert response.headers['Location'].endswith('/teacher')
+
+
+def test_student_reset_forces_a_new_password(app, admin, upload):
+    upload('students', 'roll_number,name,house_name,class_grade\nB001,Asha,Iqbal,10\nB002,Bilal,Jinnah,9\n')
+    with app.app_context():
+        User.query.filter_by(username='B001').update({'must_change_password': False})
+        db.session.commit()
+
+    page = admin.post('/admin/bulk/reset_passwords', data={'role': 'student', 'class_grade': '10'},
+                      follow_redirects=True).get_data(as_text=True)
+    assert 'Reset 1 class 10 students to their roll number; they must change it at next login' in page
+
+    client = app.test_client()
+    response = client.post('/login', data={'username': 'B001', 'password': 'B001'})
+    assert response.headers['Location'].endswith('/change_password')
@@ -0,0 +1,65 @@
+import csv
+import io
+
+import pytest
+
+STUDENTS_CSV = """roll_number,name,house_name,class_grade
+E001,Asha Khan,Iqbal,10
+E002,Bilal Ahmed,Jinnah,10
+E003,Chen Li,Sir Syed,10
+E004,Dina Malik,Iqbal,9
+"""
+FIRST_TERM_CSV = """roll_number,subject,mark
+E001,Math,40
+E002,Math,70
+E002,English,55.5
+"""
+
+
+@pytest.fixture
+def results(app, upload):
+    upload('students', STUDENTS_CSV)
+    upload('results', FIRST_TERM_CSV, class_grade='10', result_type='1st')
+
+
+def export_rows(admin, **args):
+    response = admin.get('/admin/class_results/export', query_string=args)
+    assert response.status_code == 200
+    return list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+
+
+def test_csv_export_orders_by_position_with_unranked_last(results, admin):
+    header, *rows = export_rows(admin, class_grade='10', term='first')
+
+    assert header[:4] == ['Class', 'Roll Number', 'Name', 'House']
+    assert header[-4:] == ['Obtained', 'Total', 'Percentage', 'Position']
+    by_column = [dict(zip(header, row)) for row in rows]
+    assert [(r['Roll Number'], r['Math'], r['English'], r['Obtained'], r['Total'], r['Position'])
+            for r in by_column] == [('E002', '70.0', '55.5', '125.5', '150.0', '1'),
+                                    ('E001', '40.0', '', '40.0', '75.0', '2'),
+                                    ('E003', '', '', '0.0', '0.0', '')]
+
+
+def test_csv_export_all_terms_of_all_classes(results, admin):
+    header, *rows = export_rows(admin, class_grade='all', term='all')
+
+    assert {'Math 1st', 'Math 2nd', 'Math Board', '1st Obtained', 'Board %'} <= set(header)
+    assert [(r[0], r[1]) for r in rows] == [('10', 'E002'), ('10', 'E001'), ('10', 'E003'), ('9', 'E004')]
+
+
+def test_xlsx_export_has_a_sheet_per_class(results, admin):
+    from openpyxl import load_workbook
+
+    response = admin.get('/admin/class_results/export?class_grade=all&term=first&format=xlsx')
+    workbook = load_workbook(io.BytesIO(response.data), read_only=True)
+
+    assert 'Class 10' in workbook.sheetnames and 'Class 9' in workbook.sheetnames
+    rows = list(workbook['Class 10'].values)
+    assert [r[1] for r in rows[1:]] == ['E002', 'E001', 'E003']
+    assert rows[1][-4:] == (125.5, 150, 83.67, 1)
+
+
+def test_export_rejects_bad_options(results, admin):
+    response = admin.get('/admin/class_results/export?class_grade=10&term=third')
+
+    assert response.status_code == 302
@@ -0,0 +1,85 @@
+import logging
+
+from sqlalchemy import text
+
+from app import Mark, Student, _migrate_mark_indexes, app as flask_app, db, save_marks_grid
+
+STUDENTS_CSV = """roll_number,name,house_name,class_grade
+G001,Asha Khan,Iqbal,10
+G002,Bilal Ahmed,Jinnah,10
+"""
+
+
+def student_ids(app, *rolls):
+    with app.app_context():
+        ids = dict(db.session.query(Student.roll_number, Student.id).filter(Student.roll_number.in_(rolls)))
+    return [ids[roll] for roll in rolls]
+
+
+def marks():
+    return {(sid, subj): (f, s, b) for sid, subj, f, s, b in
+            db.session.query(Mark.student_id, Mark.subject, Mark.first_term, Mark.second_term, Mark.board_mark)}
+
+
+def save(app, class_grade, form):
+    with app.app_context():
+        counts = save_marks_grid(class_grade, form)
+        db.session.commit()
+        return counts, marks()
+
+
+def test_grid_counts_changed_inserted_and_unchanged(app, upload):
+    upload('students', STUDENTS_CSV)
+    a, b = student_ids(app, 'G001', 'G002')
+
+    counts, saved = save(app, '10', {f'm-{a}-Math-first': '50', f'm-{b}-Math-first': '40', f'm-{b}-English-second': ' '})
+    assert counts == (0, 2, 0)
+    assert saved == {(a, 'Math'): (50.0, 0.0, 0.0), (b, 'Math'): (40.0, 0.0, 0.0)}
+
+    # a changed, b resubmitted as is, a new English mark, blank cells skipped
+    form = {f'm-{a}-Math-first': '60', f'm-{a}-Math-second': '', f'm-{b}-Math-first': '40',
+            f'm-{b}-Math-second': '0', f'm-{a}-English-board': '70', f'm-{b}-Urdu-first': ''}
+    counts, saved = save(app, '10', form)
+    assert counts == (1, 1, 1)
+    assert saved == {(a, 'Math'): (60.0, 0.0, 0.0), (b, 'Math'): (40.0, 0.0, 0.0), (a, 'English'): (0.0, 0.0, 70.0)}
+
+    assert save(app, '10', form)[0] == (0, 0, 3)
+
+
+def test_grid_ignores_other_classes_and_subjects(app, upload):
+    upload('students', STUDENTS_CSV + 'G003,Chen Li,Sir Syed,11\n')
+    a, c = student_ids(app, 'G001', 'G003')
+
+    assert save(app, '10', {f'm-{c}-Math-first': '50', f'm-{a}-Cooking-first': '50'}) == ((0, 0, 0), {})
+
+
+def test_grid_save_from_class_results_page(app, admin, upload):
+    upload('students', STUDENTS_CSV)
+    a, b = student_ids(app, 'G001', 'G002')
+    form = {'class_grade': '10', 'action': 'save_marks', f'm-{a}-Math-first': '50', f'm-{b}-Math-first': '40'}
+
+    page = admin.post('/admin/class_results', data=form).get_data(as_text=True)
+    assert '0 changed, 2 inserted, 0 unchanged' in page
+
+    page = admin.post('/admin/class_results', data={**form, f'm-{a}-Math-first': '55'}).get_data(as_text=True)
+    assert '1 changed, 0 inserted, 1 unchanged' in page
+    assert f'name="m-{a}-Math-first" value="55.0"' in page
+
+
+def test_mark_index_migration_logs_only_when_it_merges(app, upload, caplog):
+    upload('students', STUDENTS_CSV)
+    a, = student_ids(app, 'G001')
+    caplog.set_level(logging.INFO, logger=flask_app.logger.name)
+    with app.app_context():
+        _migrate_mark_indexes()
+        assert caplog.records == []
+
+        db.session.execute(text('DROP INDEX uq_mark_student_subject'))
+        db.session.add_all([Mark(student_id=a, subject='Math', class_grade='10', first_term=50),
+                            Mark(student_id=a, subject='Math', class_grade='10', second_term=60)])
+        db.session.flush()
+        _migrate_mark_indexes()
+        db.session.commit()
+
+        assert marks() == {(a, 'Math'): (50, 60, 0)}
+    assert caplog.records[0].getMessage() == 'merged 1 duplicate mark row(s) across 1 student/subject pair(s)'
@@ -0,0 +1,41 @@
+import html
+import re
+
+STUDENTS_CSV = 'roll_number,name,house_name,class_grade\n' + ''.join(
+    f'K{i:03d},Student {i},Iqbal,10\n' for i in range(1, 8))
+MARKS_CSV = 'roll_number,subject,mark\n' + ''.join(f'K{i:03d},Math,{40 + i}\n' for i in range(1, 8))
+NEXT_LINK = re.compile(r'href="([^"]+)">Next')
+
+
+def walk(client, url):
+    """Follow the Next links from url; the K-rolls listed on each page"""
+    pages = []
+    while url:
+        page = client.get(url).get_data(as_text=True)
+        pages.append(re.findall(r'>(K\d{3})<', page))
+        link = NEXT_LINK.search(page)
+        url = html.unescape(link.group(1)) if link else None
+    return pages
+
+
+def test_search_pages_have_no_gaps_or_repeats(app, admin, upload):
+    upload('students', STUDENTS_CSV)
+
+    pages = walk(admin, '/search?q=K&per_page=3')
+
+    assert [len(p) for p in pages] == [3, 3, 1]
+    assert sum(pages, []) == [f'K{i:03d}' for i in range(1, 8)]
+
+
+def test_teacher_dashboard_pages_survive_inserts(app, upload, teacher):
+    upload('students', STUDENTS_CSV)
+    upload('results', MARKS_CSV, class_grade='10', result_type='1st')
+
+    first = teacher.get('/teacher?per_page=3').get_data(as_text=True)
+    # a mark added before the cursor must not shift later pages the way OFFSET would
+    upload('students', 'roll_number,name,house_name,class_grade\nK000,Early Bird,Iqbal,10\n')
+    upload('results', 'roll_number,subject,mark\nK000,Math,50\n', class_grade='10', result_type='1st')
+    rest = walk(teacher, html.unescape(NEXT_LINK.search(first).group(1)))
+
+    assert re.findall(r'>(K\d{3})<', first) == ['K001', 'K002', 'K003']
+    assert sum(rest, []) == ['K004', 'K005', 'K006', 'K007']
@@ -0,0 +1,43 @@
+import io
+import zipfile
+
+from app import generate_report_cards
+
+STUDENTS_CSV = """roll_number,name,house_name,class_grade
+R001,Asha Khan,Iqbal,10
+R002,Bilal Ahmed,Jinnah,10
+R003,Chen Li,Sir Syed,10
+"""
+FIRST_TERM_CSV = """roll_number,subject,mark
+R001,Math,40
+R002,Math,70
+"""
+
+
+def test_report_cards_zip_has_a_card_per_student(app, admin, upload):
+    upload('students', STUDENTS_CSV)
+    upload('results', FIRST_TERM_CSV, class_grade='10', result_type='1st')
+
+    response = admin.get('/admin/report_cards?class_grade=10')
+
+    assert response.status_code == 200 and response.headers['X-Report-Cards'] == '3'
+    cards = zipfile.ZipFile(io.BytesIO(response.data))
+    assert sorted(cards.namelist()) == ['10/R001.pdf', '10/R002.pdf', '10/R003.pdf']
+    assert all(cards.read(name).startswith(b'%PDF-1.4') for name in cards.namelist())
+    assert b'(Bilal Ahmed)' in cards.read('10/R002.pdf') and b'(1 of 3)' in cards.read('10/R002.pdf')
+    # no marks, no position
+    assert b'(Position:) Tj ET\nBT /F1 10 Tf 150 690 Td (-)' in cards.read('10/R003.pdf')
+
+
+def test_report_cards_from_a_process_pool_match(app, upload, monkeypatch):
+    upload('students', STUDENTS_CSV)
+    upload('results', FIRST_TERM_CSV, class_grade='10', result_type='1st')
+    monkeypatch.setitem(app.config, 'REPORT_CARD_POOL_MIN', 1)
+
+    with app.app_context():
+        serial, pooled = io.BytesIO(), io.BytesIO()
+        assert generate_report_cards(['10'], serial, workers=1)[0] == 3
+        assert generate_report_cards(['10'], pooled, workers=2)[0] == 3
+
+    serial, pooled = zipfile.ZipFile(serial), zipfile.ZipFile(pooled)
+    assert {n: serial.read(n) for n in serial.namelist()} == {n: pooled.read(n) for n in pooled.namelist()}
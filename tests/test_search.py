@@ -0,0 +1,56 @@
+import pytest
+
+from app import Student, db, fts_enabled, search_students
+
+STUDENTS_CSV = """roll_number,name,house_name,class_grade
+S10,Asha Khan,Iqbal,10
+S100,Bilal Ahmed,Jinnah,10
+S2,Asad Rauf,Sir Syed,9
+X77,Sana Ashraf,Iqbal,10
+"""
+
+
+@pytest.fixture
+def students(app, upload):
+    upload('students', STUDENTS_CSV)
+    with app.app_context():
+        yield
+
+
+def rolls(students):
+    return [s.roll_number for s in students]
+
+
+def test_search_by_roll_prefix_and_name(students):
+    assert rolls(search_students('S10')) == ['S10', 'S100']
+    assert rolls(search_students('bilal ahm')) == ['S100']
+    assert set(rolls(search_students('Khan'))) == {'S10'}
+    assert search_students('   ') == []
+
+
+def test_search_ranks_roll_prefix_hits_before_name_hits(students):
+    if not fts_enabled():
+        pytest.skip('ranking needs the SQLite FTS5 index')
+    # S2 (roll prefix) first, then the name-prefix matches
+    assert rolls(search_students('S'))[0] == 'S2'
+    assert set(rolls(search_students('as'))) == {'S10', 'S2', 'X77'}
+
+
+def test_search_condition_and_limit(students):
+    assert rolls(search_students('as', condition=Student.class_grade == '9')) == ['S2']
+    assert len(search_students('S', limit=2)) == 2
+
+
+def test_search_index_follows_edits(students):
+    student = Student.query.filter_by(roll_number='X77').one()
+    student.name = 'Zoya Ashraf'
+    db.session.commit()
+
+    assert rolls(search_students('zoya')) == ['X77']
+    assert search_students('sana') == []
+
+
+def test_search_suggest(students, admin):
+    suggestions = admin.get('/search/suggest?q=bilal').get_json()
+
+    assert suggestions == [{'roll_number': 'S100', 'name': 'Bilal Ahmed', 'class_grade': '10', 'house_name': 'Jinnah'}]
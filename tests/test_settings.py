@@ -0,0 +1,24 @@
+import io
+
+
+def test_pages_render_settings_without_queries(app, queries, monkeypatch):
+    monkeypatch.setitem(app.config, 'CACHE_VERSION_TTL', 60)
+    client = app.test_client()
+    client.get('/login')
+
+    with queries:
+        page = client.get('/login').get_data(as_text=True)
+    assert queries.count == 0
+    assert 'class="logo"' in page
+
+
+def test_new_logo_shows_on_the_next_page(app, admin, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'CACHE_VERSION_TTL', 60)
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    client = app.test_client()
+    client.get('/login')
+
+    admin.post('/admin/upload_logo', data={'logo': (io.BytesIO(b'\x89PNG'), 'crest.png')})
+
+    assert (tmp_path / 'logo_crest.png').exists()
+    assert 'src="/static/uploads/logo_crest.png"' in client.get('/login').get_data(as_text=True)
@@ -0,0 +1,13 @@
+import statistics
+
+import bench_startup
+
+
+def test_startup_within_budget(rms):
+    # rms has created and migrated the database, so each probe takes init_db's fast path
+    results = [bench_startup.probe() for _ in range(3)]
+
+    assert not any(r['pandas'] for r in results), 'pandas must stay out of the startup path'
+    total_ms = statistics.median(r['total'] for r in results) * 1000
+    assert total_ms <= bench_startup.BUDGET_MS, \
+        f'median startup {total_ms:.0f} ms is over the {bench_startup.BUDGET_MS:.0f} ms budget'
@@ -0,0 +1,92 @@
+import pytest
+
+from app import Mark, Student, _student_pages, db
+
+STUDENTS_CSV = """roll_number,name,house_name,class_grade
+P001,Asha Khan,Iqbal,10
+P002,Bilal Ahmed,Jinnah,10
+"""
+
+
+@pytest.fixture
+def student(app, upload):
+    """Test client logged in as student P001 (default password changed), after one dashboard visit"""
+    upload('students', STUDENTS_CSV)
+    with app.app_context():
+        sid = db.session.query(Student.id).filter_by(roll_number='P001').scalar()
+        db.session.add(Mark(student_id=sid, subject='Math', class_grade='10', first_term=41.0,
+                            second_term=0.0, board_mark=0.0))
+        db.session.commit()
+    client = app.test_client()
+    client.post('/login', data={'username': 'P001', 'password': 'P001'})
+    client.post('/change_password', data={'password': 'secret1', 'confirm_password': 'secret1'})
+    client.get('/student')  # shows the flashed message, so is not cached
+    client.sid = sid
+    return client
+
+
+def test_refresh_is_answered_without_queries(app, student, queries, monkeypatch):
+    monkeypatch.setitem(app.config, 'CACHE_VERSION_TTL', 60)  # however slow this machine is
+    page = student.get('/student')
+    assert page.status_code == 200 and '41.0/100' in page.get_data(as_text=True)
+    etag = page.headers['ETag']
+    assert page.headers['Cache-Control'] == 'private, no-cache'
+
+    with queries:
+        assert student.get('/student', headers={'If-None-Match': etag}).status_code == 304
+        cached = student.get('/student')
+    assert queries.count == 0
+    assert cached.status_code == 200 and cached.headers['ETag'] == etag
+    assert cached.get_data() == page.get_data()
+
+
+def test_committed_marks_change_the_tag(app, admin, student):
+    etag = student.get('/student').headers['ETag']
+
+    admin.post('/admin/class_results', data={'class_grade': '10', 'action': 'save_marks',
+                                             f'm-{student.sid}-Math-first': '57'})
+
+    page = student.get('/student', headers={'If-None-Match': etag})
+    assert page.status_code == 200
+    assert page.headers['ETag'] != etag
+    assert '57.0/100' in page.get_data(as_text=True)
+
+
+def test_other_students_marks_change_the_tag(app, student):
+    etag = student.get('/student').headers['ETag']
+
+    with app.app_context():
+        other = db.session.query(Student.id).filter_by(roll_number='P002').scalar()
+        db.session.add(Mark(student_id=other, subject='Math', class_grade='10', first_term=70.0,
+                            second_term=0.0, board_mark=0.0))
+        db.session.commit()
+
+    # P001's class position changed
+    assert student.get('/student', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_deleted_student_gets_no_cached_page(app, admin, student):
+    etag = student.get('/student').headers['ETag']
+    with app.app_context():
+        user_id = db.session.get(Student, student.sid).user_id
+
+    admin.get(f'/admin/delete_student/{user_id}')
+
+    for headers in ({'If-None-Match': etag}, {}):
+        response = student.get('/student', headers=headers)
+        assert response.status_code == 302 and '/login' in response.headers['Location']
+
+
+def test_published_pages_match_the_students_own(app, admin, student, queries, monkeypatch):
+    monkeypatch.setitem(app.config, 'CACHE_VERSION_TTL', 60)
+    rendered = student.get('/student').get_data(as_text=True)
+    _student_pages.clear()
+
+    # the admin still has the login message pending; it must not end up in the students' pages
+    admin.post('/admin/publish_results', data={'class_grade': '10'})
+
+    with queries:
+        served = student.get('/student').get_data(as_text=True)
+    assert queries.count == 0
+    assert served == rendered
+    assert 'Logged in successfully' not in served
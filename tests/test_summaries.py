@@ -0,0 +1,90 @@
+import pytest
+
+from app import SUMMARY_TERMS, Mark, Student, StudentResultSummary, class_analytics, compute_class_results, db, \
+    delete_students, rebuild_result_summaries, save_marks_grid
+from dataset import generate_college
+
+
+def summary_rows():
+    return sorted(db.session.query(StudentResultSummary.student_id, StudentResultSummary.class_grade,
+                                   StudentResultSummary.term, StudentResultSummary.obtained,
+                                   StudentResultSummary.possible, StudentResultSummary.percent,
+                                   StudentResultSummary.position))
+
+
+def assert_matches_rebuild():
+    kept = summary_rows()
+    rebuild_result_summaries()
+    rebuilt = summary_rows()
+    db.session.rollback()
+    assert len(kept) == len(rebuilt)
+    for row, expected in zip(kept, rebuilt):
+        assert row[:3] == expected[:3]
+        assert row[3:6] == pytest.approx(expected[3:6])
+        assert row[6] == expected[6]
+
+
+@pytest.fixture
+def college(app, upload):
+    students, results = generate_college(6)
+    upload('students', students.to_csv(index=False))
+    for (class_grade, result_type), df in results.items():
+        if class_grade in ('9', '10') and result_type != 'board':
+            upload('results', df.to_csv(index=False), class_grade=class_grade, result_type=result_type)
+    with app.app_context():
+        yield students
+
+
+def test_uploads_keep_summaries_consistent(college):
+    assert StudentResultSummary.query.count() == len(college) * 4
+    assert_matches_rebuild()
+
+
+def test_edits_keep_summaries_consistent(college):
+    ids = dict(db.session.query(Student.roll_number, Student.id))
+    save_marks_grid('10', {f'm-{ids["1000000"]}-Math-first': '75', f'm-{ids["1000001"]}-Urdu-board': '30'})
+    db.session.commit()
+    assert_matches_rebuild()
+
+    moved = db.session.get(Student, ids['1000002'])
+    moved.class_grade = '9'
+    db.session.commit()
+    assert_matches_rebuild()
+
+    db.session.delete(Mark.query.filter_by(student_id=ids['900000']).first())
+    db.session.commit()
+    assert_matches_rebuild()
+
+    delete_students(Student.roll_number.in_(['900001', '1000003']))
+    db.session.commit()
+    assert_matches_rebuild()
+
+
+def test_class_results_follow_marks_committed_elsewhere(app, college):
+    sid = db.session.query(Student.id).filter_by(roll_number='1000000').scalar()
+    before = next(r for r in compute_class_results('10') if r['id'] == sid)
+
+    # another request (or worker) commits the change, not this session
+    with app.app_context():
+        Mark.query.filter_by(student_id=sid, subject='Math').one().board_mark = 70.0
+        db.session.commit()
+
+    after = next(r for r in compute_class_results('10') if r['id'] == sid)
+    assert after['obtained_total'] == pytest.approx(before['obtained_total'] + 70.0)
+
+
+def test_students_without_marks_get_no_position(app, upload):
+    upload('students', 'roll_number,name,house_name,class_grade\nN001,Asha,Iqbal,10\nN002,Bilal,Jinnah,10\n'
+                       'N003,Chen,Iqbal,10\n')
+    upload('results', 'roll_number,subject,mark\nN001,Math,40\nN003,Math,60\n', class_grade='10', result_type='1st')
+
+    with app.app_context():
+        positions = {(roll, term): position for roll, term, position in
+                     db.session.query(Student.roll_number, StudentResultSummary.term, StudentResultSummary.position)
+                     .join(StudentResultSummary, StudentResultSummary.student_id == Student.id)}
+        assert {term: positions[('N002', term)] for term in SUMMARY_TERMS} == dict.fromkeys(SUMMARY_TERMS)
+        assert (positions[('N003', 'first')], positions[('N001', 'first')]) == (1, 2)
+        assert {r['roll']: r['position'] for r in compute_class_results('10')} == {'N001': 2, 'N002': None, 'N003': 1}
+        assert [(p['roll'], p['position']) for p in class_analytics('10', 'first')['positions']] == \
+            [('N003', 1), ('N001', 2)]
+        assert_matches_rebuild()
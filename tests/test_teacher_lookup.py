@@ -0,0 +1,30 @@
+STUDENTS_CSV = """roll_number,name,house_name,class_grade
+L001,Asha Khan,Iqbal,10
+L002,Asad Ali,Jinnah,10
+L003,Asim Raza,Jinnah,9
+"""
+
+
+def lookup(client, **params):
+    return client.get('/teacher/students/lookup', query_string=params)
+
+
+def test_lookup_lists_students_without_a_mark_in_the_subject(app, teacher, upload):
+    upload('students', STUDENTS_CSV)
+    upload('results', 'roll_number,subject,mark\nL002,Math,50\nL001,English,60\n', class_grade='10', result_type='1st')
+
+    assert [s['roll_number'] for s in lookup(teacher, q='L00').get_json()] == ['L001', 'L003']
+    assert lookup(teacher, q='as', class_grade='10').get_json() == \
+        [{'roll_number': 'L001', 'name': 'Asha Khan', 'class_grade': '10'}]
+
+
+def test_lookup_rejects_unknown_classes(app, teacher, upload):
+    upload('students', STUDENTS_CSV)
+
+    assert lookup(teacher, q='L00', class_grade='13').status_code == 400
+    assert lookup(teacher, q='L00', class_grade="10' OR 1=1").status_code == 400
+    assert lookup(teacher, q='L00', class_grade='').status_code == 200
+
+
+def test_lookup_is_for_teachers_only(app, admin):
+    assert lookup(admin, q='L00').status_code == 403
@@ -0,0 +1,72 @@
+from app import Mark, Student, db
+
+STUDENTS_CSV = """roll_number,name,house_name,class_grade
+T001,Asha Khan,Iqbal,10
+T002,,Jinnah,10
+T003,Bilal Ahmed,Jinnah,7
+T001,Asha Again,Iqbal,10
+T004,Chen Li,Sir Syed,11
+"""
+
+
+def test_student_upload_reports_bad_rows(app, admin, upload):
+    job = upload('students', STUDENTS_CSV)
+
+    assert job['status'] == 'done'
+    assert (job['processed_rows'], job['success_count'], job['error_count']) == (5, 2, 3)
+    assert job['rows_per_second'] > 0
+    assert job['errors'] == [
+        'Row 3: Invalid data (missing roll/name or invalid class)',
+        'Row 4: Invalid data (missing roll/name or invalid class)',
+        "Row 5: Roll number 'T001' already exists",
+    ]
+    with app.app_context():
+        assert sorted(roll for (roll,) in db.session.query(Student.roll_number)) == ['T001', 'T004']
+    report = admin.get(job['report_url']).get_data(as_text=True).splitlines()
+    assert report[0] == 'row,error'
+    assert [line.split(',')[0] for line in report[1:]] == ['3', '4', '5']
+    assert '<th>Rows/s</th>' in admin.get('/admin/upload_students').get_data(as_text=True)
+
+
+def test_student_upload_rejects_existing_rolls(app, upload):
+    upload('students', STUDENTS_CSV)
+    job = upload('students', 'roll_number,name,house_name,class_grade\nT004,Chen Li,Sir Syed,11\nT005,Dina,Iqbal,9\n')
+
+    assert (job['success_count'], job['error_count']) == (1, 1)
+    assert job['errors'] == ["Row 2: Roll number 'T004' already exists"]
+
+
+def test_results_upload_reports_bad_rows(app, upload):
+    upload('students', STUDENTS_CSV)
+    job = upload('results', """roll_number,subject,mark
+T001,Math,61.5
+T001,English,abc
+T999,Math,50
+T004,Math,50
+T001,Cooking,50
+T001,Urdu,80
+T001,English,70
+""", class_grade='10', result_type='2nd')
+
+    assert job['status'] == 'done'
+    assert (job['success_count'], job['error_count']) == (2, 5)
+    assert job['errors'] == [
+        "Row 3: Invalid mark value 'abc'",
+        "Row 4: Student with roll 'T999' not found in class 10",
+        "Row 5: Student with roll 'T004' not found in class 10",
+        "Row 6: Subject 'Cooking' not valid for class 10",
+        'Row 7: Mark 80.0 exceeds full mark 75 for Urdu',
+    ]
+    with app.app_context():
+        marks = {m.subject: (m.first_term, m.second_term)
+                 for m in Mark.query.join(Student).filter(Student.roll_number == 'T001')}
+    assert marks == {'Math': (0.0, 61.5), 'English': (0.0, 70.0)}
+
+
+def test_upload_without_required_columns_fails(app, upload):
+    job = upload('students', 'roll,name\nT001,Asha\n')
+
+    assert job['status'] == 'failed'
+    assert 'File must contain columns' in job['message']
+    with app.app_context():
+        assert Student.query.count() == 0